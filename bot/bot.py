@@ -20,6 +20,7 @@ Environment variables (~/.config/ai-agents/profiles/default.env):
 
 Architecture:
     Config         - Environment variable loading and validation
+    TmuxControl    - Persistent tmux control-mode connection
     TmuxManager    - Tmux session operations (list, send, capture)
     MessageRouter  - Message parsing and command routing
     SlackBot       - Main orchestrator with Slack event/action handlers
@@ -27,24 +28,35 @@ Architecture:
 
 from __future__ import annotations
 
+import atexit
+import functools
 import json
 import os
 import signal
 import sys
 import re
+import shutil
 import subprocess
 import logging
+import logging.handlers
+import queue
 import threading
 import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from slack_bolt import App
+from slack_bolt import App, BoltResponse
 from slack_bolt.adapter.socket_mode import SocketModeHandler
+from slack_bolt.context import BoltContext
 from slack_bolt.context.ack import Ack
 from slack_bolt.context.respond import Respond
 from slack_bolt.context.say import Say
 
+# Absolute path to tmux, resolved once so spawns skip the PATH search.
+_TMUX: str = shutil.which("tmux") or "tmux"
+
 
 # ===================================================================
 # Config
@@ -70,6 +82,10 @@ class Config:
         BUTTON_VALUE_MAX_LENGTH: Maximum character length for Slack button values.
         STATUS_PANE_MAX_LENGTH: Maximum character length for status pane output.
         STATUS_LINE_MAX_LENGTH: Maximum character length for a single status line.
+        STATUS_SUMMARY_LINES: Number of history lines captured per session
+            for the ``status`` overview.
+        WORKER_POOL_SIZE: Number of worker threads running Slack listeners
+            and Socket Mode envelope handlers.
     """
 
     ENV_FILE: Path = Path.home() / ".config/ai-agents/profiles/default.env"
@@ -78,6 +94,8 @@ class Config:
     BUTTON_VALUE_MAX_LENGTH: int = 1900
     STATUS_PANE_MAX_LENGTH: int = 2500
     STATUS_LINE_MAX_LENGTH: int = 80
+    STATUS_SUMMARY_LINES: int = 5
+    WORKER_POOL_SIZE: int = 16
 
     def __init__(self, env_file: Path | None = None) -> None:
         """Initialize configuration by loading and validating environment variables.
@@ -117,15 +135,34 @@ class Config:
         Raises:
             FileNotFoundError: If ``self.ENV_FILE`` does not exist.
         """
-        if not self.ENV_FILE.exists():
-            raise FileNotFoundError(f"{self.ENV_FILE} が見つかりません")
-        env: dict[str, str] = {}
-        for line in self.ENV_FILE.read_text().splitlines():
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, _, value = line.partition("=")
-                env[key.strip()] = value.strip()
-        return env
+        try:
+            mtime_ns: int = self.ENV_FILE.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{self.ENV_FILE} が見つかりません") from None
+        return dict(self._parse_env_file(self.ENV_FILE, mtime_ns))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _parse_env_file(path: Path, _mtime_ns: int) -> dict[str, str]:
+        """Parse an environment file, memoized per path and modification time.
+
+        Repeated loads of an unchanged file cost a single ``stat()``; an
+        edited file is re-parsed. Callers must not mutate the result.
+
+        Args:
+            path: The environment file to parse.
+            _mtime_ns: The file's modification time; only part of the
+                       cache key.
+
+        Returns:
+            A dictionary mapping variable names to their string values.
+        """
+        with path.open(encoding="utf-8") as f:
+            return {
+                key.strip(): value.strip()
+                for key, sep, value in (line.strip().partition("=") for line in f)
+                if sep and not key.startswith("#")
+            }
 
     def _validate(self) -> None:
         """Validate that all required environment variables are set.
@@ -141,15 +178,253 @@ class Config:
             raise ValueError("SLACK_ALLOWED_USER が未設定です（セキュリティのため必須）")
 
     def _configure_logging(self) -> None:
-        """Set up file and console logging handlers."""
+        """Set up file and console logging behind a queue.
+
+        Log calls only enqueue the record; a ``QueueListener`` thread does
+        the formatting and the file/console writes, so Slack handlers never
+        block on log I/O. The listener is flushed and stopped at exit.
+        """
+        formatter = logging.Formatter(self.LOG_FORMAT)
+        handlers: list[logging.Handler] = [
+            logging.FileHandler(self.LOG_DIR / "bot.log"),
+            logging.StreamHandler(),
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        # The queue side only merges the %-args into the message; the full
+        # LOG_FORMAT is applied once, by the listener's handlers.
         logging.basicConfig(
             level=logging.INFO,
-            format=self.LOG_FORMAT,
-            handlers=[
-                logging.FileHandler(self.LOG_DIR / "bot.log"),
-                logging.StreamHandler(),
-            ],
+            format="%(message)s",
+            handlers=[logging.handlers.QueueHandler(log_queue)],
         )
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True,
+        )
+        listener.start()
+        atexit.register(listener.stop)
+
+
+# ===================================================================
+# TmuxControl
+# ===================================================================
+
+
+class TmuxControl:
+    """Persistent tmux control-mode (``tmux -C``) connection.
+
+    Keeps a single control client attached to a hidden session and
+    issues commands over its stdin, reading the ``%begin``/``%end``
+    framed replies from stdout. This replaces a fork/exec of the tmux
+    binary per command with a line write on an open pipe.
+
+    Attributes:
+        SESSION_NAME: Name of the hidden session the control client owns.
+        REPLY_TIMEOUT: Seconds to wait for each reply line before the
+            connection is treated as lost.
+        session_name: The session name used by this connection.
+    """
+
+    SESSION_NAME: str = "__slack_bridge__"
+    REPLY_TIMEOUT: float = 5.0
+
+    # Characters that must be escaped inside a double-quoted tmux argument.
+    # Control characters are written as octal escapes so that a multi-line
+    # prompt stays on a single command line; "~" is escaped because tmux
+    # expands a leading one to the home directory even inside quotes.
+    _QUOTE_TABLE: dict[int, str] = {
+        **{c: f"\\{c:03o}" for c in range(0x20)},
+        0x7F: "\\177",
+        ord("\\"): "\\\\",
+        ord('"'): '\\"',
+        ord("$"): "\\$",
+        ord("~"): "\\~",
+    }
+
+    def __init__(self, session_name: str = SESSION_NAME) -> None:
+        """Initialize an unconnected control client.
+
+        Args:
+            session_name: Name of the hidden session to create or attach.
+        """
+        self.session_name: str = session_name
+        self._proc: subprocess.Popen[str] | None = None
+        self._lines: queue.SimpleQueue[str] = queue.SimpleQueue()
+        self._lock: threading.Lock = threading.Lock()
+        self.log: logging.Logger = logging.getLogger(__name__)
+
+    @property
+    def connected(self) -> bool:
+        """Whether the control client process is running."""
+        return self._proc is not None and self._proc.poll() is None
+
+    @classmethod
+    def quote(cls, arg: str) -> str:
+        """Quote a single argument for a tmux command line.
+
+        Args:
+            arg: The raw argument.
+
+        Returns:
+            The argument wrapped in double quotes with tmux escapes applied.
+        """
+        return '"' + arg.translate(cls._QUOTE_TABLE) + '"'
+
+    def start(self) -> bool:
+        """Launch the control client.
+
+        Returns:
+            True if the connection is ready, False if tmux is unavailable
+            or refused the control client.
+        """
+        with self._lock:
+            self._close_locked()
+            try:
+                proc = subprocess.Popen(
+                    [_TMUX, "-C", "new-session", "-A", "-s", self.session_name],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL, text=True, encoding="utf-8",
+                    errors="replace", bufsize=1,
+                )
+            except OSError as e:
+                self.log.warning("tmux control mode unavailable: %s", e)
+                return False
+            self._attach(proc)
+            # The reply to the initial new-session command is not flagged as
+            # client-issued, so consume it explicitly.
+            if self._read_reply(initial=True) is None:
+                self._close_locked()
+                return False
+        # Tear the hidden session down together with the control client.
+        return self.run(
+            ["set-option", "-t", self.session_name, "destroy-unattached", "on"],
+        ) is not None
+
+    def _attach(self, proc: subprocess.Popen[str]) -> None:
+        """Adopt a control client process and start pumping its output.
+
+        stdout is drained by a daemon thread into a queue so that reply
+        reads can time out instead of blocking in ``readline()``.
+
+        Args:
+            proc: The running ``tmux -C`` process.
+        """
+        lines: queue.SimpleQueue[str] = queue.SimpleQueue()
+
+        def pump() -> None:
+            assert proc.stdout is not None
+            try:
+                for line in proc.stdout:
+                    lines.put(line)
+            except (OSError, ValueError):
+                pass
+            lines.put("")
+
+        self._proc = proc
+        self._lines = lines
+        threading.Thread(target=pump, name="tmux-control-reader", daemon=True).start()
+
+    def _readline(self) -> str:
+        """Return the next output line, or "" on EOF or reply timeout."""
+        try:
+            return self._lines.get(timeout=self.REPLY_TIMEOUT)
+        except queue.Empty:
+            self.log.warning("tmux control reply timed out")
+            return ""
+
+    def close(self) -> None:
+        """Terminate the control client, if running."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        """Terminate the control client; the caller must hold the lock."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
+    def _read_reply(self, initial: bool = False) -> tuple[bool, list[str]] | None:
+        """Read the next command reply block from the control client.
+
+        Notifications outside reply blocks are skipped, as are blocks not
+        issued by this client (unless ``initial`` is set).
+
+        Args:
+            initial: Accept the block answering the startup command.
+
+        Returns:
+            A tuple of ``(succeeded, output_lines)``, or None if the
+            connection was lost or stopped answering.
+        """
+        while True:
+            line = self._readline()
+            if not line or line.startswith("%exit"):
+                return None
+            if not line.startswith("%begin "):
+                continue
+            guard = line[len("%begin "):].rstrip("\n")
+            body: list[str] = []
+            while True:
+                line = self._readline()
+                if not line:
+                    return None
+                line = line.rstrip("\n")
+                if line == f"%end {guard}" or line == f"%error {guard}":
+                    break
+                body.append(line)
+            if initial or guard.endswith(" 1"):
+                return line.startswith("%end"), body
+
+    def run(self, *commands: Sequence[str]) -> tuple[int, str] | None:
+        """Run a tmux command, or a chain of commands, over the connection.
+
+        Every argument is quoted, so argument values (including a literal
+        ``";"``) can never split the chain; separators are only inserted
+        between the given commands.
+
+        A connection lost after the command line was written is reported
+        as a failure rather than None: tmux may already have run the
+        commands, and repeating them (e.g. ``send-keys``) would type the
+        text twice.
+
+        Args:
+            commands: One argument list per tmux command.
+
+        Returns:
+            A tuple of ``(returncode, stdout)`` mirroring a tmux subprocess
+            run, or None if nothing could be sent over the connection.
+        """
+        line = " ; ".join(" ".join(map(self.quote, command)) for command in commands)
+        with self._lock:
+            if not self.connected:
+                return None
+            assert self._proc is not None and self._proc.stdin is not None
+            try:
+                self._proc.stdin.write(line + "\n")
+                self._proc.stdin.flush()
+            except (OSError, ValueError) as e:
+                self.log.warning("tmux control connection lost: %s", e)
+                self._close_locked()
+                return None
+            output: list[str] = []
+            for _ in commands:
+                reply = self._read_reply()
+                if reply is None:
+                    self.log.warning("tmux control reply lost; not retrying %r", commands[0][0])
+                    self._close_locked()
+                    return 1, ""
+                ok, body = reply
+                if not ok:
+                    return 1, "".join(f"{b}\n" for b in output)
+                output.extend(body)
+        return 0, "".join(f"{b}\n" for b in output)
 
 
 # ===================================================================
@@ -161,12 +436,31 @@ class TmuxManager:
     """Manages interactions with tmux sessions.
 
     Provides methods to list, verify, send text to, and capture output
-    from tmux sessions via subprocess calls.
+    from tmux sessions. Commands go through a persistent ``TmuxControl``
+    connection when one is attached, and fall back to subprocess calls.
 
     Attributes:
         capture_lines: Number of lines to capture from the tmux pane.
+        control: Optional control-mode connection used instead of
+            spawning a tmux process per command.
+        CAPTURE_SEPARATOR: Marker printed between panes in a batched capture.
+        SESSIONS_CACHE_TTL: Seconds a ``list_sessions()`` result is reused.
+        CAPTURE_FALLBACK_WORKERS: Maximum threads used to capture sessions
+            individually after a batched capture aborts.
+        CONTROL_RECONNECT_INTERVAL: Minimum seconds between attempts to
+            restart a dropped control connection.
+        MISSING_PANE: Placeholder returned by ``capture()`` when the
+            session cannot be captured.
     """
 
+    CAPTURE_SEPARATOR: str = "__SLACK_BRIDGE_EOS__"
+    SESSIONS_CACHE_TTL: float = 1.0
+    CAPTURE_FALLBACK_WORKERS: int = 8
+    CONTROL_RECONNECT_INTERVAL: float = 5.0
+    MISSING_PANE: str = "(セッションなし)"
+
+    _LIST_SESSIONS_ARGS: tuple[str, ...] = ("list-sessions", "-F", "#{session_name}")
+
     def __init__(self, capture_lines: int = 50) -> None:
         """Initialize the TmuxManager.
 
@@ -175,36 +469,152 @@ class TmuxManager:
                            (default: 50).
         """
         self.capture_lines: int = capture_lines
+        self.control: TmuxControl | None = None
+        self._sessions_cache: tuple[float, list[str]] | None = None
+        self._sessions_lock: threading.Lock = threading.Lock()
+        self._reconnect_lock: threading.Lock = threading.Lock()
+        self._next_reconnect: float = 0.0
+
+    @staticmethod
+    def _cli_argv(commands: Sequence[Sequence[str]]) -> list[str]:
+        """Build a tmux argv running ``commands`` as one chain.
+
+        tmux treats any argument ending in ``;`` as a command separator,
+        so such arguments are escaped as ``\\;`` to stay literal.
+
+        Args:
+            commands: One argument list per tmux command.
+
+        Returns:
+            The argv, starting with the tmux executable.
+        """
+        argv: list[str] = [_TMUX]
+        for i, command in enumerate(commands):
+            if i:
+                argv.append(";")
+            argv.extend(a[:-1] + "\\;" if a.endswith(";") else a for a in command)
+        return argv
+
+    def _run(self, *commands: Sequence[str], capture: bool = True) -> tuple[int, str]:
+        """Run a tmux command or chain, preferring the control-mode connection.
+
+        The subprocess fallback is only used when nothing was sent over
+        the connection, so a command is never executed twice.
+
+        Args:
+            commands: One argument list per tmux command (without the
+                      ``tmux`` executable); several are run as a chain.
+            capture: Whether stdout is needed. When False, the subprocess
+                     fallback discards output instead of creating pipes.
+
+        Returns:
+            A tuple of ``(returncode, stdout)``. ``stdout`` is empty when
+            ``capture`` is False and the subprocess fallback was used.
+        """
+        control = self.control
+        if control is not None:
+            if not control.connected:
+                self._reconnect_control(control)
+            reply = control.run(*commands)
+            if reply is not None:
+                return reply
+        argv = self._cli_argv(commands)
+        if not capture:
+            result = subprocess.run(
+                argv, stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False,
+            )
+            return result.returncode, ""
+        # Read raw bytes and decode once; pane content is not guaranteed to
+        # be valid UTF-8, which text=True would reject with an exception.
+        result = subprocess.run(
+            argv, stdin=subprocess.DEVNULL, capture_output=True, check=False,
+        )
+        return result.returncode, result.stdout.decode("utf-8", "replace")
+
+    def _reconnect_control(self, control: TmuxControl) -> None:
+        """Restart a dropped control connection, at most once per interval.
+
+        Callers that find a reconnect already in progress or too recent
+        simply use the subprocess fallback for this command.
+
+        Args:
+            control: The disconnected control-mode connection.
+        """
+        if not self._reconnect_lock.acquire(blocking=False):
+            return
+        try:
+            now = time.monotonic()
+            if control.connected or now < self._next_reconnect:
+                return
+            self._next_reconnect = now + self.CONTROL_RECONNECT_INTERVAL
+            if control.start():
+                control.log.info("tmux control mode reconnected")
+        finally:
+            self._reconnect_lock.release()
+
+    def _cached_sessions(self) -> list[str] | None:
+        """Return the cached session list if it is still fresh, else None."""
+        cached = self._sessions_cache
+        if cached is None or time.monotonic() - cached[0] >= self.SESSIONS_CACHE_TTL:
+            return None
+        return cached[1]
+
+    def invalidate_sessions(self) -> None:
+        """Drop the cached session list so the next lookup queries tmux."""
+        self._sessions_cache = None
 
     def list_sessions(self) -> list[str]:
         """Return a list of running tmux session names.
 
+        Results are cached for ``SESSIONS_CACHE_TTL`` seconds, since a
+        single Slack event typically looks up the session list more than
+        once while the topology rarely changes in between. Concurrent
+        callers that miss the cache share a single tmux query.
+
         Returns:
             A list of session name strings. Returns an empty list if
             tmux is not running.
         """
-        result = subprocess.run(
-            ["tmux", "list-sessions", "-F", "#{session_name}"],
-            capture_output=True, text=True,
-        )
-        if result.returncode != 0:
-            return []
-        return [s.strip() for s in result.stdout.splitlines() if s.strip()]
+        cached = self._cached_sessions()
+        if cached is not None:
+            return list(cached)
+        # Single-flight: concurrent misses wait for one refresh and share it.
+        with self._sessions_lock:
+            cached = self._cached_sessions()
+            if cached is not None:
+                return list(cached)
+            returncode, stdout = self._run(self._LIST_SESSIONS_ARGS)
+            sessions: list[str] = []
+            if returncode == 0:
+                sessions = [
+                    s.strip() for s in stdout.splitlines()
+                    if s.strip() and s.strip() != TmuxControl.SESSION_NAME
+                ]
+            self._sessions_cache = (time.monotonic(), sessions)
+        return list(sessions)
 
     def session_exists(self, name: str) -> bool:
         """Check whether a tmux session with the given name exists.
 
+        A fresh cached session list answers positively without spawning
+        tmux; otherwise ``has-session`` is queried. A failed probe
+        invalidates the cache.
+
         Args:
             name: The session name to check.
 
         Returns:
             True if the session exists, False otherwise.
         """
-        result = subprocess.run(
-            ["tmux", "has-session", "-t", name],
-            capture_output=True,
-        )
-        return result.returncode == 0
+        cached = self._cached_sessions()
+        if cached is not None and name in cached:
+            return True
+        returncode, _ = self._run(["has-session", "-t", name], capture=False)
+        if returncode != 0:
+            self.invalidate_sessions()
+            return False
+        return True
 
     def send(self, session: str, text: str) -> bool:
         """Send text to a tmux session followed by an Enter keystroke.
@@ -217,36 +627,102 @@ class TmuxManager:
             True if the text was sent successfully, False if the
             session does not exist.
         """
-        if not self.session_exists(session):
-            return False
-        subprocess.run(
-            ["tmux", "send-keys", "-t", session, "-l", text],
-        )
-        subprocess.run(
-            ["tmux", "send-keys", "-t", session, "Enter"],
+        # One chained command: the literal text (``--`` so a leading "-" is
+        # not taken as a flag) and then Enter. A missing session makes the
+        # chain fail, so no separate has-session probe is needed.
+        returncode, _ = self._run(
+            ["send-keys", "-t", session, "-l", "--", text],
+            ["send-keys", "-t", session, "Enter"],
+            capture=False,
         )
+        if returncode != 0:
+            self.invalidate_sessions()
+            return False
         return True
 
-    def capture(self, session: str, lines: int | None = None) -> str:
+    def read_pane(self, session: str, lines: int) -> str | None:
+        """Return the stripped last ``lines`` lines of a pane, or None on failure.
+
+        Args:
+            session: The session name to capture.
+            lines: Number of lines to capture.
+
+        Returns:
+            The pane text, or None if tmux could not capture the session.
+        """
+        returncode, stdout = self._run(
+            ["capture-pane", "-t", session, "-p", "-S", f"-{lines}"],
+        )
+        return stdout.strip() if returncode == 0 else None
+
+    def capture(
+        self, session: str, lines: int | None = None, max_length: int | None = None,
+    ) -> str:
         """Capture the current pane content of a tmux session.
 
         Args:
             session: The session name to capture.
             lines: Number of lines to capture. Defaults to
                    ``self.capture_lines``.
+            max_length: If given, keep only the last ``max_length``
+                        characters, prefixed with ``"...\\n"``.
 
         Returns:
-            The captured pane text. Returns ``"(セッションなし)"`` if
-            the session does not exist, or ``"(空)"`` if the pane is empty.
+            The captured pane text. Returns ``MISSING_PANE`` if the
+            session does not exist, or ``"(空)"`` if the pane is empty.
         """
-        if not self.session_exists(session):
-            return "(セッションなし)"
-        capture_count = lines if lines is not None else self.capture_lines
-        result = subprocess.run(
-            ["tmux", "capture-pane", "-t", session, "-p", "-S", f"-{capture_count}"],
-            capture_output=True, text=True,
+        pane = self.read_pane(
+            session, lines if lines is not None else self.capture_lines,
         )
-        return result.stdout.strip() or "(空)"
+        if pane is None:
+            self.invalidate_sessions()
+            return self.MISSING_PANE
+        if max_length is not None and len(pane) > max_length:
+            return "...\n" + pane[-max_length:]
+        return pane or "(空)"
+
+    def capture_many(
+        self, sessions: list[str], lines: int | None = None,
+    ) -> dict[str, str]:
+        """Capture the panes of several sessions with a single tmux invocation.
+
+        Chains one ``capture-pane`` per session, each followed by a
+        ``display-message`` separator, so N sessions cost one fork/exec
+        instead of 2N. tmux aborts the chain at the first failing
+        command; any sessions left uncaptured fall back to ``capture()``,
+        run concurrently since the per-session calls are independent.
+
+        Args:
+            sessions: The session names to capture.
+            lines: Number of lines to capture. Defaults to
+                   ``self.capture_lines``.
+
+        Returns:
+            A dictionary mapping each session name to its pane text,
+            using the same placeholders as ``capture()``.
+        """
+        if not sessions:
+            return {}
+        capture_count = lines if lines is not None else self.capture_lines
+        commands: list[list[str]] = []
+        for s in sessions:
+            commands += [
+                ["capture-pane", "-t", s, "-p", "-S", f"-{capture_count}"],
+                ["display-message", "-p", self.CAPTURE_SEPARATOR],
+            ]
+        _, stdout = self._run(*commands)
+        chunks: list[str] = stdout.split(self.CAPTURE_SEPARATOR + "\n")[:-1]
+        panes: dict[str, str] = {
+            s: chunk.strip() or "(空)" for s, chunk in zip(sessions, chunks)
+        }
+        rest: list[str] = sessions[len(panes):]
+        if rest:
+            workers = min(len(rest), self.CAPTURE_FALLBACK_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                panes.update(zip(
+                    rest, executor.map(lambda s: self.capture(s, capture_count), rest),
+                ))
+        return panes
 
 
 # ===================================================================
@@ -264,13 +740,19 @@ class MessageRouter:
     Attributes:
         COMMAND_SESSIONS: Set of command strings that trigger session listing.
         COMMAND_STATUS: The command prefix for status queries.
+        COMMAND_LIST: Canonical name of the session-listing command.
         CC_PREFIX: Optional prefix that is stripped from messages.
     """
 
     COMMAND_SESSIONS: frozenset[str] = frozenset({"sessions", "ls"})
     COMMAND_STATUS: str = "status"
+    COMMAND_LIST: str = "sessions"
     CC_PREFIX: str = "cc:"
 
+    # Exact-match command aliases -> canonical command name.
+    _COMMAND_ALIASES: dict[str, str] = dict.fromkeys(COMMAND_SESSIONS, COMMAND_LIST)
+    _COMMAND_ALIAS_MAX_LEN: int = max(map(len, _COMMAND_ALIASES))
+
     _MENTION_RE: re.Pattern[str] = re.compile(r"^@(\S+)\s+(.*)", re.DOTALL)
 
     def parse_mention(self, text: str) -> tuple[str | None, str]:
@@ -286,6 +768,8 @@ class MessageRouter:
             A tuple of ``(session_name, message_body)``. If no mention
             is found, returns ``(None, original_text)``.
         """
+        if not text.startswith("@"):
+            return None, text
         m = self._MENTION_RE.match(text)
         if m:
             return m.group(1), m.group(2).strip()
@@ -301,10 +785,35 @@ class MessageRouter:
             The text with the ``cc:`` prefix removed and stripped, or the
             original text if the prefix is not present.
         """
-        if text.lower().startswith(self.CC_PREFIX):
+        if text[:len(self.CC_PREFIX)].lower() == self.CC_PREFIX:
             return text[len(self.CC_PREFIX):].strip()
         return text
 
+    def parse_command(self, text: str) -> str | None:
+        """Classify the text as a special command.
+
+        Only the leading characters are lowercased, so long prompts are
+        not copied just to rule them out. ``status`` must be followed by
+        whitespace or the end of the text.
+
+        Args:
+            text: The message text.
+
+        Returns:
+            ``COMMAND_STATUS`` for a status query, ``COMMAND_LIST`` for a
+            session-listing command, or None for a regular prompt.
+        """
+        if text[:1].isspace() or text[-1:].isspace():
+            text = text.strip()
+        n = len(self.COMMAND_STATUS)
+        if text[:n].lower() == self.COMMAND_STATUS:
+            boundary = text[n:n + 1]
+            if not boundary or boundary.isspace():
+                return self.COMMAND_STATUS
+        if len(text) > self._COMMAND_ALIAS_MAX_LEN:
+            return None
+        return self._COMMAND_ALIASES.get(text.lower())
+
     def is_status_command(self, text: str) -> bool:
         """Check whether the text is a status command.
 
@@ -314,7 +823,7 @@ class MessageRouter:
         Returns:
             True if the text starts with ``'status'``.
         """
-        return text.lower().strip().startswith(self.COMMAND_STATUS)
+        return self.parse_command(text) == self.COMMAND_STATUS
 
     def is_sessions_command(self, text: str) -> bool:
         """Check whether the text is a session-listing command.
@@ -325,7 +834,7 @@ class MessageRouter:
         Returns:
             True if the text matches ``'sessions'`` or ``'ls'``.
         """
-        return text.lower().strip() in self.COMMAND_SESSIONS
+        return self.parse_command(text) == self.COMMAND_LIST
 
     def is_valid_command(self, text: str) -> bool:
         """Check whether the text is any recognized special command.
@@ -336,7 +845,7 @@ class MessageRouter:
         Returns:
             True if the text is a status or sessions command.
         """
-        return self.is_status_command(text) or self.is_sessions_command(text)
+        return self.parse_command(text) is not None
 
 
 # ===================================================================
@@ -357,9 +866,50 @@ class SlackBot:
         router: The message parser and router.
         app: The Slack Bolt ``App`` instance.
         log: The logger for this bot instance.
+        ACTION_ID_PATTERN: Matches every action_id this bot handles. It is
+            anchored so that actions registered by other handlers on the same
+            app are not captured.
+        PENDING_APPROVALS_MAX: Maximum number of tracked approval notifications.
+        PENDING_APPROVAL_TTL: Seconds after which an unresolved approval
+            notification stops being tracked.
+        PENDING_POLL_INTERVAL: Seconds between approval poller ticks.
+        PENDING_COLD_AFTER: Age in seconds after which a pending approval
+            is polled only every ``PENDING_COLD_POLL_EVERY`` ticks.
+        PENDING_COLD_POLL_EVERY: Tick stride for cold pending approvals.
     """
 
     PENDING_APPROVALS_FILE: Path = Path.home() / ".claude/slack-bot/pending_approvals.json"
+    ACTION_ID_PATTERN: re.Pattern[str] = re.compile(r"^(?:send_to_.+|hook_approve|hook_deny)$")
+    PENDING_APPROVALS_MAX: int = 128
+    PENDING_APPROVAL_TTL: float = 3600.0
+    PENDING_POLL_INTERVAL: float = 3.0
+    PENDING_COLD_AFTER: float = 300.0
+    PENDING_COLD_POLL_EVERY: int = 10
+
+    # Fixed reply texts, built once instead of per message.
+    _EMPTY_PROMPT_TEXT: str = "メッセージが空です。指示を入力してください。"
+    _NO_SESSIONS_TEXT: str = ":x: tmux セッションが見つかりません。`tcc` で起動してください。"
+    _NO_SESSIONS_MAC_TEXT: str = (
+        ":x: tmux セッションが見つかりません。Mac で `tcc` を実行してください。"
+    )
+    _SESSION_NOT_FOUND_TMPL: str = ":x: `{}` が見つかりません。"
+    _PICKER_TEXT: str = "送信先を選択してください"
+    _PICKER_HEADER: str = f":arrow_right: *{_PICKER_TEXT}:*\n> "
+
+    # Static part of the chat.update payload that marks a notification as
+    # resolved; built once and merged into each request.
+    _RESOLVED_TEXT: str = ":white_check_mark: *ローカルで許可済み*"
+    _RESOLVED_PAYLOAD: dict[str, Any] = {
+        "text": _RESOLVED_TEXT,
+        "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": _RESOLVED_TEXT}}],
+    }
+    # Replaces the buttons of notifications that stop being tracked, so a
+    # late click can never answer whatever prompt the session shows then.
+    _EXPIRED_TEXT: str = ":hourglass: *期限切れ（ローカルで確認してください）*"
+    _EXPIRED_PAYLOAD: dict[str, Any] = {
+        "text": _EXPIRED_TEXT,
+        "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": _EXPIRED_TEXT}}],
+    }
 
     def __init__(self, config: Config) -> None:
         """Initialize the SlackBot with the given configuration.
@@ -372,17 +922,37 @@ class SlackBot:
             capture_lines=config.PANE_CAPTURE_LIMIT,
         )
         self.router: MessageRouter = MessageRouter()
-        self.app: App = App(token=config.SLACK_BOT_TOKEN)
+        # Bolt acks events before running listeners on this pool, so a slow
+        # tmux round-trip never holds up the next Socket Mode delivery.
+        self.app: App = App(
+            token=config.SLACK_BOT_TOKEN,
+            listener_executor=ThreadPoolExecutor(
+                max_workers=config.WORKER_POOL_SIZE,
+                thread_name_prefix="slack-bridge",
+            ),
+        )
         self.log: logging.Logger = logging.getLogger(__name__)
+        self._command_handlers: dict[str, Callable[[str, Say], None]] = {
+            MessageRouter.COMMAND_STATUS: self._handle_status,
+            MessageRouter.COMMAND_LIST: self._handle_sessions_list,
+        }
+        self._action_handlers: dict[
+            str, Callable[[dict[str, Any], Respond, Say], None]
+        ] = {
+            "send_to": self._handle_session_select,
+            "hook_approve": self._handle_hook_approve,
+            "hook_deny": self._handle_hook_deny,
+        }
+        # Last rendered ``sessions`` reply, reused while the list is unchanged.
+        self._sessions_list_cache: tuple[list[str], str] | None = None
 
         self._register_handlers()
 
     def _register_handlers(self) -> None:
-        """Register all Slack event and action handlers on the app."""
+        """Register the auth middleware and all Slack event and action handlers."""
+        self.app.use(self._authorize)
         self.app.event("message")(self._handle_message)
-        self.app.action(re.compile(r"send_to_.*"))(self._handle_session_select)
-        self.app.action("hook_approve")(self._handle_hook_approve)
-        self.app.action("hook_deny")(self._handle_hook_deny)
+        self.app.action(self.ACTION_ID_PATTERN)(self._handle_action)
 
     # --- Authorization ---
 
@@ -397,50 +967,83 @@ class SlackBot:
         """
         return user_id == self.config.SLACK_ALLOWED_USER
 
+    def _authorize(
+        self,
+        context: BoltContext,
+        body: dict[str, Any],
+        ack: Ack,
+        next_: Callable[[], None],
+    ) -> BoltResponse | None:
+        """Global middleware that lets only the allowed user's requests through.
+
+        Runs once per request before listener dispatch, so individual
+        handlers need no authorization checks. Rejected requests are
+        acknowledged so that Slack does not retry them. Only DMs and block
+        actions from other users are warned about; channel traffic, bot
+        messages and subtype events are dropped at DEBUG level.
+
+        Args:
+            context: The Bolt request context (carries the acting user ID).
+            body: The raw Slack request body.
+            ack: Acknowledge function for the Slack request.
+            next_: Continues to the matching listener.
+
+        Returns:
+            The acknowledgement response for rejected requests, or None
+            once the request has been passed on.
+        """
+        # Compared inline rather than via is_allowed(): this runs per request.
+        if context.user_id == self.config.SLACK_ALLOWED_USER:
+            next_()
+            return None
+        event = body.get("event") or {}
+        if body.get("type") == "block_actions" or (
+            event.get("channel_type") == "im"
+            and not event.get("bot_id")
+            and not event.get("subtype")
+        ):
+            self.log.warning("Unauthorized user: %s", context.user_id)
+        else:
+            self.log.debug("Ignoring request from %s", context.user_id)
+        return ack()
+
     # --- Event Handlers ---
 
     def _handle_message(self, event: dict[str, Any], say: Say) -> None:
         """Handle incoming Slack DM messages and route them appropriately.
 
-        Ignores bot messages and messages with subtypes. Routes special
-        commands (status, sessions/ls) to their handlers, and forwards
-        regular messages to tmux sessions.
+        Ignores non-DM events, bot messages and messages with subtypes
+        before doing any other work. Routes special commands (status,
+        sessions/ls) to their handlers, and forwards regular messages to
+        tmux sessions.
 
         Args:
             event: The Slack event payload.
             say: Callable to send messages back to Slack.
         """
-        if event.get("bot_id") or event.get("subtype"):
+        if (
+            event.get("channel_type") != "im"
+            or event.get("bot_id")
+            or event.get("subtype")
+        ):
             return
 
-        user: str = event.get("user", "")
         text: str = event.get("text", "").strip()
-        channel_type: str = event.get("channel_type", "")
 
-        self.log.info(
-            f"Message from user: {user}, channel_type: {channel_type}, text: {text[:50]}"
-        )
-
-        if channel_type != "im":
-            return
-        if not self.is_allowed(user):
-            self.log.warning(f"Unauthorized user: {user}")
-            return
+        if self.log.isEnabledFor(logging.INFO):
+            self.log.info("Message from user: %s, text: %s", event.get("user", ""), text[:50])
 
         # Strip optional cc: prefix
         prompt: str = self.router.strip_cc_prefix(text)
 
         if not prompt:
-            say("メッセージが空です。指示を入力してください。")
+            say(self._EMPTY_PROMPT_TEXT)
             return
 
         # --- Special commands ---
-        if self.router.is_status_command(prompt):
-            self._handle_status(prompt, say)
-            return
-
-        if self.router.is_sessions_command(prompt):
-            self._handle_sessions_list(say)
+        command: str | None = self.router.parse_command(prompt)
+        if command is not None:
+            self._command_handlers[command](prompt, say)
             return
 
         # --- @mention parsing ---
@@ -454,7 +1057,7 @@ class SlackBot:
         sessions: list[str] = self.tmux.list_sessions()
 
         if len(sessions) == 0:
-            say(":x: tmux セッションが見つかりません。Mac で `tcc` を実行してください。")
+            say(self._NO_SESSIONS_MAC_TEXT)
             return
 
         if len(sessions) == 1:
@@ -475,48 +1078,55 @@ class SlackBot:
             say: Callable to send messages back to Slack.
         """
         parts: list[str] = prompt.split(maxsplit=1)
-        sessions: list[str] = self.tmux.list_sessions()
 
         if len(parts) >= 2:
             target: str = parts[1].strip()
-            if self.tmux.session_exists(target):
-                pane: str = self.tmux.capture(target)
-                if len(pane) > self.config.STATUS_PANE_MAX_LENGTH:
-                    pane = "...\n" + pane[-self.config.STATUS_PANE_MAX_LENGTH:]
-                say(f":white_check_mark: `{target}` は稼働中\n```\n{pane}\n```")
+            pane: str = self.tmux.capture(
+                target, max_length=self.config.STATUS_PANE_MAX_LENGTH,
+            )
+            if pane == TmuxManager.MISSING_PANE:
+                say(self._SESSION_NOT_FOUND_TMPL.format(target))
             else:
-                say(f":x: `{target}` が見つかりません。")
+                say(f":white_check_mark: `{target}` は稼働中\n```\n{pane}\n```")
             return
 
+        sessions: list[str] = self.tmux.list_sessions()
+
         if not sessions:
-            say(":x: tmux セッションが見つかりません。`tcc` で起動してください。")
+            say(self._NO_SESSIONS_TEXT)
             return
 
+        panes: dict[str, str] = self.tmux.capture_many(
+            sessions, self.config.STATUS_SUMMARY_LINES,
+        )
         lines: list[str] = []
         for s in sessions:
-            pane = self.tmux.capture(s)
-            last_lines: list[str] = [line for line in pane.splitlines() if line.strip()]
-            last_line: str = last_lines[-1] if last_lines else "(空)"
+            # Panes come back stripped, so their last line is non-blank.
+            last_line: str = panes[s].rpartition("\n")[2]
             if len(last_line) > self.config.STATUS_LINE_MAX_LENGTH:
                 last_line = last_line[:self.config.STATUS_LINE_MAX_LENGTH] + "..."
             lines.append(f":white_check_mark: `{s}`: {last_line}")
 
         say(f":computer: セッション一覧 ({len(sessions)}個):\n" + "\n".join(lines))
 
-    def _handle_sessions_list(self, say: Say) -> None:
+    def _handle_sessions_list(self, _prompt: str, say: Say) -> None:
         """List all running tmux sessions.
 
         Args:
+            _prompt: The user's command string (unused).
             say: Callable to send messages back to Slack.
         """
         sessions: list[str] = self.tmux.list_sessions()
         if not sessions:
-            say(":x: tmux セッションが見つかりません。`tcc` で起動してください。")
+            say(self._NO_SESSIONS_TEXT)
             return
-        lines: list[str] = [f":computer: *セッション一覧 ({len(sessions)}個)*"]
-        for s in sessions:
-            lines.append(f"  • `{s}`")
-        say("\n".join(lines))
+        cached = self._sessions_list_cache
+        if cached is None or cached[0] != sessions:
+            text: str = f":computer: *セッション一覧 ({len(sessions)}個)*\n" + "\n".join(
+                f"  • `{s}`" for s in sessions
+            )
+            cached = self._sessions_list_cache = (sessions, text)
+        say(cached[1])
 
     def _send_to_session(self, session: str, prompt: str, say: Say) -> None:
         """Send a message to the specified tmux session and notify Slack.
@@ -526,13 +1136,12 @@ class SlackBot:
             prompt: The message to send.
             say: Callable to send messages back to Slack.
         """
-        if not self.tmux.session_exists(session):
-            say(f":x: `{session}` が見つかりません。")
-            return
-
         if self.tmux.send(session, prompt):
-            self.log.info(f"Sent to tmux:{session}: {prompt[:80]}")
+            self.log.info("Sent to tmux:%s: %s", session, prompt[:80])
             say(f":arrow_right: `{session}` に送信しました:\n> {prompt}")
+        elif not self.tmux.session_exists(session):
+            # Only probe on failure, to tell a missing session apart.
+            say(self._SESSION_NOT_FOUND_TMPL.format(session))
         else:
             say(f":x: `{session}` への送信に失敗しました。")
 
@@ -546,14 +1155,16 @@ class SlackBot:
             prompt: The message to embed in button values.
             say: Callable to send messages back to Slack.
         """
-        prompt_for_btn: str = prompt[:self.config.BUTTON_VALUE_MAX_LENGTH]
+        # The prompt is identical for every button, so JSON-encode it once
+        # and splice it into each value; only the short name is encoded per button.
+        prompt_json: str = json.dumps(prompt[:self.config.BUTTON_VALUE_MAX_LENGTH])
 
         buttons: list[dict[str, Any]] = [
             {
                 "type": "button",
                 "text": {"type": "plain_text", "text": f":computer: {name}"},
                 "action_id": f"send_to_{name}",
-                "value": json.dumps({"session": name, "prompt": prompt_for_btn}),
+                "value": f'{{"session": {json.dumps(name)}, "prompt": {prompt_json}}}',
             }
             for name in sessions
         ]
@@ -563,23 +1174,45 @@ class SlackBot:
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f":arrow_right: *送信先を選択してください:*\n> {prompt}",
+                    "text": self._PICKER_HEADER + prompt,
                 },
             },
             {"type": "actions", "elements": buttons},
         ]
 
-        say(blocks=blocks, text="送信先を選択してください")
+        say(blocks=blocks, text=self._PICKER_TEXT)
 
     # --- Action Handlers ---
 
-    def _handle_session_select(
+    def _handle_action(
         self,
         ack: Ack,
         action: dict[str, Any],
         respond: Respond,
         say: Say,
-        body: dict[str, Any],
+    ) -> None:
+        """Acknowledge a button press and route it by action_id prefix.
+
+        The routing key is the first two ``_``-separated words of the
+        action_id (``send_to_worker1`` -> ``send_to``).
+
+        Args:
+            ack: Acknowledge function for the Slack request.
+            action: The action payload.
+            respond: Callable to update the original message.
+            say: Callable to send messages back to Slack.
+        """
+        ack()
+        key: str = "_".join(action.get("action_id", "").split("_", 2)[:2])
+        handler = self._action_handlers.get(key)
+        if handler is not None:
+            handler(action, respond, say)
+
+    def _handle_session_select(
+        self,
+        action: dict[str, Any],
+        respond: Respond,
+        say: Say,
     ) -> None:
         """Handle session selection button presses.
 
@@ -587,17 +1220,10 @@ class SlackBot:
         it to the selected tmux session.
 
         Args:
-            ack: Acknowledge function for the Slack request.
             action: The action payload containing the button value.
             respond: Callable to update the original message.
             say: Callable to send messages back to Slack.
-            body: The full request body.
         """
-        ack()
-        user: str = body.get("user", {}).get("id", "")
-        if not self.is_allowed(user):
-            return
-
         try:
             data: dict[str, str] = json.loads(action["value"])
         except (json.JSONDecodeError, KeyError):
@@ -618,7 +1244,7 @@ class SlackBot:
             return
 
         if self.tmux.send(session, prompt):
-            self.log.info(f"Sent to tmux:{session}: {prompt[:80]}")
+            self.log.info("Sent to tmux:%s: %s", session, prompt[:80])
             respond(
                 text=f":arrow_right: `{session}` に送信: {prompt[:60]}",
                 replace_original=True,
@@ -631,24 +1257,19 @@ class SlackBot:
 
     def _handle_hook_approve(
         self,
-        ack: Ack,
         action: dict[str, Any],
         respond: Respond,
-        body: dict[str, Any],
+        _say: Say,
     ) -> None:
         """Handle the 'approve' button from hook input notifications.
 
         Sends ``'y'`` to the tmux session to approve the pending action.
 
         Args:
-            ack: Acknowledge function for the Slack request.
             action: The action payload (value contains session name).
             respond: Callable to update the original message.
-            body: The full request body.
+            _say: Callable to send messages back to Slack (unused).
         """
-        ack()
-        if not self.is_allowed(body.get("user", {}).get("id", "")):
-            return
         session: str = action.get("value", "") or self.config.DEFAULT_SESSION
         self.clear_pending_approvals()
         if self.tmux.send(session, "y"):
@@ -664,24 +1285,19 @@ class SlackBot:
 
     def _handle_hook_deny(
         self,
-        ack: Ack,
         action: dict[str, Any],
         respond: Respond,
-        body: dict[str, Any],
+        _say: Say,
     ) -> None:
         """Handle the 'deny' button from hook input notifications.
 
         Sends ``'n'`` to the tmux session to reject the pending action.
 
         Args:
-            ack: Acknowledge function for the Slack request.
             action: The action payload (value contains session name).
             respond: Callable to update the original message.
-            body: The full request body.
+            _say: Callable to send messages back to Slack (unused).
         """
-        ack()
-        if not self.is_allowed(body.get("user", {}).get("id", "")):
-            return
         session: str = action.get("value", "") or self.config.DEFAULT_SESSION
         self.clear_pending_approvals()
         if self.tmux.send(session, "n"):
@@ -701,59 +1317,112 @@ class SlackBot:
         """Remove the pending approvals file when a Slack button is pressed."""
         self.PENDING_APPROVALS_FILE.unlink(missing_ok=True)
 
-    def _resolve_slack_messages(self, entries: list[dict[str, Any]]) -> None:
-        """Update unresolved Slack notifications to show 'locally approved'."""
+    def prune_pending_approvals(
+        self, pending: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Drop stale entries and cap the size of the pending approvals list.
+
+        Entries whose Slack message (``ts``) is older than
+        ``PENDING_APPROVAL_TTL`` are discarded; these belong to prompts
+        that will never be resolved, e.g. because the session has exited.
+        Only the newest ``PENDING_APPROVALS_MAX`` entries are kept. The
+        caller must still mark the dropped entries' Slack messages as
+        expired, since the hooks only update entries left in the file.
+
+        Args:
+            pending: Entries as written by the notification hook.
+
+        Returns:
+            The entries that should still be tracked, oldest first.
+        """
+        cutoff: float = time.time() - self.PENDING_APPROVAL_TTL
+        fresh: list[dict[str, Any]] = []
+        for entry in pending:
+            try:
+                ts = float(entry.get("ts", 0))
+            except (TypeError, ValueError):
+                continue
+            if ts >= cutoff:
+                fresh.append(entry)
+        return fresh[-self.PENDING_APPROVALS_MAX:]
+
+    def _resolve_slack_messages(
+        self,
+        entries: list[dict[str, Any]],
+        resolution: dict[str, Any] | None = None,
+    ) -> None:
+        """Update unresolved Slack notifications, removing their buttons.
+
+        Args:
+            entries: Pending approval entries (``channel`` and ``ts``).
+            resolution: The ``text``/``blocks`` to show instead; defaults
+                        to 'locally approved'.
+        """
+        if resolution is None:
+            resolution = self._RESOLVED_PAYLOAD
         import urllib.request
-        resolve_text = ":white_check_mark: *ローカルで許可済み*"
+        headers: dict[str, str] = {
+            "Authorization": f"Bearer {self.config.SLACK_BOT_TOKEN}",
+            "Content-Type": "application/json; charset=utf-8",
+        }
         for entry in entries:
             try:
                 payload = {
                     "channel": entry["channel"],
                     "ts": entry["ts"],
-                    "text": resolve_text,
-                    "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": resolve_text}}],
+                    **resolution,
                 }
                 req = urllib.request.Request(
                     "https://slack.com/api/chat.update",
                     data=json.dumps(payload).encode("utf-8"),
-                    headers={
-                        "Authorization": f"Bearer {self.config.SLACK_BOT_TOKEN}",
-                        "Content-Type": "application/json; charset=utf-8",
-                    },
+                    headers=headers,
                     method="POST",
                 )
                 urllib.request.urlopen(req, timeout=10)
             except Exception as e:
-                self.log.warning(f"Failed to resolve Slack message: {e}")
+                self.log.warning("Failed to resolve Slack message: %s", e)
 
     def _poll_pending_approvals(self) -> None:
         """Background thread: monitor tmux pane changes to detect local approvals."""
         self.log.info("Polling thread started for pending approvals")
+        tick = 0
         while True:
-            time.sleep(3)
+            time.sleep(self.PENDING_POLL_INTERVAL)
+            tick += 1
             if not self.PENDING_APPROVALS_FILE.exists():
                 continue
             try:
                 pending = json.loads(self.PENDING_APPROVALS_FILE.read_text())
             except Exception:
                 continue
+            kept = self.prune_pending_approvals(pending)
+            if len(kept) != len(pending):
+                self._resolve_slack_messages(
+                    [e for e in pending if e not in kept], self._EXPIRED_PAYLOAD,
+                )
+                pending = kept
+                if pending:
+                    self.PENDING_APPROVALS_FILE.write_text(json.dumps(pending))
+                else:
+                    self.PENDING_APPROVALS_FILE.unlink(missing_ok=True)
             if not pending:
                 continue
 
             resolved = []
+            cold_cutoff = time.time() - self.PENDING_COLD_AFTER
+            poll_cold = tick % self.PENDING_COLD_POLL_EVERY == 0
             for entry in pending:
                 session = entry.get("session", "")
                 snapshot = entry.get("pane_snapshot")
                 if not session:
                     resolved.append(entry)
                     continue
-                result = subprocess.run(
-                    ["tmux", "capture-pane", "-t", session, "-p", "-S", "-5"],
-                    capture_output=True, text=True,
-                )
-                if result.returncode != 0:
+                # Long-unanswered prompts rarely change; poll them less often.
+                if snapshot and not poll_cold and float(entry.get("ts", 0)) < cold_cutoff:
+                    continue
+                current = self.tmux.read_pane(session, 5)
+                if current is None:
                     continue
-                current = result.stdout.strip()
                 if not snapshot:
                     entry["pane_snapshot"] = current
                     try:
@@ -762,7 +1431,7 @@ class SlackBot:
                         pass
                     continue
                 if current != snapshot:
-                    self.log.info(f"Pane change detected for session '{session}', resolving notification")
+                    self.log.info("Pane change detected for session '%s', resolving notification", session)
                     resolved.append(entry)
 
             if resolved:
@@ -782,11 +1451,20 @@ class SlackBot:
         try:
             old_pid: int = int(self.config.PID_FILE.read_text().strip())
             os.kill(old_pid, signal.SIGTERM)
-            self.log.info(f"既存プロセス (PID {old_pid}) を停止しました")
+            self.log.info("既存プロセス (PID %d) を停止しました", old_pid)
         except (ValueError, ProcessLookupError, PermissionError):
             pass
         self.config.PID_FILE.unlink(missing_ok=True)
 
+    def _connect_tmux_control(self) -> None:
+        """Attach a persistent tmux control-mode connection to the manager."""
+        control = TmuxControl()
+        if control.start():
+            self.tmux.control = control
+            self.log.info("tmux control mode connected")
+        else:
+            self.log.warning("tmux control mode unavailable; falling back to subprocess")
+
     def _cleanup(self, _sig: int = 0, _frame: Any = None) -> None:
         """Remove the PID file and exit on termination signals."""
         self.config.PID_FILE.unlink(missing_ok=True)
@@ -796,7 +1474,8 @@ class SlackBot:
         """Start the Slack Bot in Socket Mode.
 
         Kills any existing bot process, writes the current PID file,
-        registers signal handlers, and starts the Socket Mode handler.
+        registers signal handlers, connects tmux control mode, and starts
+        the Socket Mode handler.
         """
         self._kill_existing()
         self.config.PID_FILE.write_text(str(os.getpid()))
@@ -804,17 +1483,25 @@ class SlackBot:
         signal.signal(signal.SIGINT, self._cleanup)
 
         self.log.info(
-            f"Slack Bot 起動中... (PID {os.getpid()}, "
-            f"default session: {self.config.DEFAULT_SESSION})"
+            "Slack Bot 起動中... (PID %d, default session: %s)",
+            os.getpid(), self.config.DEFAULT_SESSION,
         )
 
+        self._connect_tmux_control()
+
         poller = threading.Thread(target=self._poll_pending_approvals, daemon=True)
         poller.start()
 
         try:
-            handler = SocketModeHandler(self.app, self.config.SLACK_APP_TOKEN)
+            handler = SocketModeHandler(
+                self.app,
+                self.config.SLACK_APP_TOKEN,
+                concurrency=self.config.WORKER_POOL_SIZE,
+            )
             handler.start()
         finally:
+            if self.tmux.control is not None:
+                self.tmux.control.close()
             self.config.PID_FILE.unlink(missing_ok=True)
 
 
@@ -985,7 +1672,7 @@ try:
     register_handlers(app)
     log.info("Content Scout 提案ハンドラー登録完了")
 except ImportError as e:
-    log.warning(f"Content Scout ハンドラー未登録（モジュール未検出）: {e}")
+    log.warning("Content Scout ハンドラー未登録（モジュール未検出）: %s", e)
 
 
 # --- Entry point ---
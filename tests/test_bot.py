@@ -7,12 +7,19 @@ functions. Uses mocked subprocess and Slack API calls.
 
 from __future__ import annotations
 
+import io
 import json
+import os
+import re
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from unittest.mock import MagicMock, patch, mock_open
 
 import pytest
+from slack_bolt.context import BoltContext
 
 
 # ---------------------------------------------------------------------------
@@ -34,10 +41,14 @@ def _make_completed(
     returncode: int = 0,
     stdout: str = "",
     stderr: str = "",
-) -> subprocess.CompletedProcess[str]:
-    """Helper to build a CompletedProcess for mocking subprocess.run."""
+) -> subprocess.CompletedProcess[bytes]:
+    """Helper to build a CompletedProcess for mocking subprocess.run.
+
+    tmux is run without ``text=True``, so output is encoded to bytes.
+    """
     return subprocess.CompletedProcess(
-        args=[], returncode=returncode, stdout=stdout, stderr=stderr,
+        args=[], returncode=returncode,
+        stdout=stdout.encode(), stderr=stderr.encode(),
     )
 
 
@@ -65,12 +76,31 @@ def _patch_env(tmp_path: Any) -> Any:
     bot_mod._bot.config.SLACK_ALLOWED_USER = original_bot_config_allowed
 
 
+@pytest.fixture
+def mock_run(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace subprocess.run as seen by the bot module with a MagicMock."""
+    import bot.bot as bot_mod
+    mock = MagicMock()
+    monkeypatch.setattr(bot_mod.subprocess, "run", mock)
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def _reset_tmux_caches() -> Any:
+    """Clear cached tmux session lists so tests never see stale results."""
+    import bot.bot as bot_mod
+    bot_mod._tmux.invalidate_sessions()
+    bot_mod._bot.tmux.invalidate_sessions()
+    yield
+
+
 # We must patch Path methods before importing bot.bot, because
 # Config() runs at module level and checks ENV_FILE.exists().
 from pathlib import Path
 
 _original_exists = Path.exists
-_original_read_text = Path.read_text
+_original_open = Path.open
+_original_stat = Path.stat
 
 
 def _patched_exists(self: Path) -> bool:
@@ -79,10 +109,16 @@ def _patched_exists(self: Path) -> bool:
     return _original_exists(self)
 
 
-def _patched_read_text(self: Path, *args: Any, **kwargs: Any) -> str:
+def _patched_stat(self: Path, *args: Any, **kwargs: Any) -> os.stat_result:
     if "default.env" in str(self):
-        return _ENV_FILE_CONTENT
-    return _original_read_text(self, *args, **kwargs)
+        return os.stat_result((0o100644, 0, 0, 1, 0, 0, len(_ENV_FILE_CONTENT), 0, 0, 0))
+    return _original_stat(self, *args, **kwargs)
+
+
+def _patched_open(self: Path, *args: Any, **kwargs: Any) -> Any:
+    if "default.env" in str(self):
+        return io.StringIO(_ENV_FILE_CONTENT)
+    return _original_open(self, *args, **kwargs)
 
 
 _mock_auth_response = MagicMock()
@@ -93,7 +129,8 @@ _mock_auth_response.status_code = 200
 _mock_auth_response.__bool__ = lambda self: True
 
 with patch.object(Path, "exists", _patched_exists), \
-     patch.object(Path, "read_text", _patched_read_text), \
+     patch.object(Path, "open", _patched_open), \
+     patch.object(Path, "stat", _patched_stat), \
      patch("slack_sdk.web.client.WebClient.auth_test", return_value=_mock_auth_response):
     import bot.bot as bot_mod
 
@@ -105,34 +142,73 @@ with patch.object(Path, "exists", _patched_exists), \
 class TestTmuxListSessions:
     """Tests for TmuxManager.list_sessions() via tmux_list_sessions()."""
 
-    @patch("bot.bot.subprocess.run")
     def test_returns_session_names(self, mock_run: MagicMock) -> None:
         """Should return a list of session names when tmux is running."""
         mock_run.return_value = _make_completed(stdout="claude\nworker1\nworker2\n")
         result = bot_mod.tmux_list_sessions()
         assert result == ["claude", "worker1", "worker2"]
 
-    @patch("bot.bot.subprocess.run")
     def test_returns_empty_on_failure(self, mock_run: MagicMock) -> None:
         """Should return an empty list when tmux is not running."""
         mock_run.return_value = _make_completed(returncode=1)
         result = bot_mod.tmux_list_sessions()
         assert result == []
 
-    @patch("bot.bot.subprocess.run")
     def test_strips_whitespace(self, mock_run: MagicMock) -> None:
         """Should strip leading/trailing whitespace from session names."""
         mock_run.return_value = _make_completed(stdout="  claude  \n  worker1  \n")
         result = bot_mod.tmux_list_sessions()
         assert result == ["claude", "worker1"]
 
-    @patch("bot.bot.subprocess.run")
     def test_skips_blank_lines(self, mock_run: MagicMock) -> None:
         """Should skip blank lines in tmux output."""
         mock_run.return_value = _make_completed(stdout="claude\n\n\nworker1\n")
         result = bot_mod.tmux_list_sessions()
         assert result == ["claude", "worker1"]
 
+    def test_caches_within_ttl(self, mock_run: MagicMock) -> None:
+        """Should reuse the session list until the cache is invalidated."""
+        mock_run.return_value = _make_completed(stdout="claude\n")
+        assert bot_mod.tmux_list_sessions() == ["claude"]
+        assert bot_mod.tmux_list_sessions() == ["claude"]
+        assert mock_run.call_count == 1
+        bot_mod._tmux.invalidate_sessions()
+        bot_mod.tmux_list_sessions()
+        assert mock_run.call_count == 2
+
+    def test_coalesces_concurrent_refreshes(self, mock_run: MagicMock) -> None:
+        """Concurrent cache misses should share a single tmux query."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_run(*args: Any, **kwargs: Any) -> subprocess.CompletedProcess[bytes]:
+            started.set()
+            release.wait(timeout=5)
+            return _make_completed(stdout="claude\n")
+
+        mock_run.side_effect = slow_run
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = executor.submit(bot_mod.tmux_list_sessions)
+            started.wait(timeout=5)
+            rest = [executor.submit(bot_mod.tmux_list_sessions) for _ in range(3)]
+            release.set()
+            results = [f.result(timeout=5) for f in [first, *rest]]
+        assert results == [["claude"]] * 4
+        assert mock_run.call_count == 1
+
+    def test_refreshes_after_ttl(self, mock_run: MagicMock) -> None:
+        """Should query tmux again once the TTL has elapsed."""
+        mock_run.return_value = _make_completed(stdout="claude\n")
+        ttl = bot_mod.TmuxManager.SESSIONS_CACHE_TTL
+        with patch("bot.bot.time.monotonic", return_value=1000.0):
+            bot_mod.tmux_list_sessions()
+        with patch("bot.bot.time.monotonic", return_value=1000.0 + ttl - 0.01):
+            bot_mod.tmux_list_sessions()
+        assert mock_run.call_count == 1
+        with patch("bot.bot.time.monotonic", return_value=1000.0 + ttl):
+            bot_mod.tmux_list_sessions()
+        assert mock_run.call_count == 2
+
 
 # ===================================================================
 # TmuxManager.session_exists (via module-level tmux_session_exists)
@@ -141,18 +217,23 @@ class TestTmuxListSessions:
 class TestTmuxSessionExists:
     """Tests for TmuxManager.session_exists() via tmux_session_exists()."""
 
-    @patch("bot.bot.subprocess.run")
     def test_returns_true_when_exists(self, mock_run: MagicMock) -> None:
         """Should return True when the session exists."""
         mock_run.return_value = _make_completed(returncode=0)
         assert bot_mod.tmux_session_exists("claude") is True
 
-    @patch("bot.bot.subprocess.run")
     def test_returns_false_when_missing(self, mock_run: MagicMock) -> None:
         """Should return False when the session does not exist."""
         mock_run.return_value = _make_completed(returncode=1)
         assert bot_mod.tmux_session_exists("nonexistent") is False
 
+    def test_answers_from_cached_sessions(self, mock_run: MagicMock) -> None:
+        """Should not spawn has-session when the cached list has the session."""
+        mock_run.return_value = _make_completed(stdout="claude\n")
+        bot_mod.tmux_list_sessions()
+        assert bot_mod.tmux_session_exists("claude") is True
+        assert mock_run.call_count == 1
+
 
 # ===================================================================
 # TmuxManager.send (via module-level tmux_send)
@@ -161,16 +242,27 @@ class TestTmuxSessionExists:
 class TestTmuxSend:
     """Tests for TmuxManager.send() via tmux_send()."""
 
-    @patch("bot.bot.subprocess.run")
     def test_sends_text_and_enter(self, mock_run: MagicMock) -> None:
-        """Should call send-keys twice (text + Enter) and return True."""
+        """Should send text and Enter in one chained tmux call."""
         mock_run.return_value = _make_completed(returncode=0)
         result = bot_mod.tmux_send("claude", "hello")
         assert result is True
-        # has-session + send-keys (text) + send-keys (Enter)
-        assert mock_run.call_count == 3
+        assert mock_run.call_count == 1
+        cmd = mock_run.call_args[0][0]
+        assert cmd == [
+            bot_mod._TMUX, "send-keys", "-t", "claude", "-l", "--", "hello", ";",
+            "send-keys", "-t", "claude", "Enter",
+        ]
+
+    def test_send_discards_output(self, mock_run: MagicMock) -> None:
+        """Should not inherit stdin or open output pipes for send-keys."""
+        mock_run.return_value = _make_completed(returncode=0)
+        bot_mod.tmux_send("claude", "hello")
+        kwargs = mock_run.call_args[1]
+        assert kwargs["stdin"] is subprocess.DEVNULL
+        assert kwargs["stdout"] is subprocess.DEVNULL
+        assert "capture_output" not in kwargs
 
-    @patch("bot.bot.subprocess.run")
     def test_returns_false_when_session_missing(self, mock_run: MagicMock) -> None:
         """Should return False if the session does not exist."""
         mock_run.return_value = _make_completed(returncode=1)
@@ -185,37 +277,39 @@ class TestTmuxSend:
 class TestTmuxCapture:
     """Tests for TmuxManager.capture() via tmux_capture()."""
 
-    @patch("bot.bot.subprocess.run")
     def test_captures_pane_content(self, mock_run: MagicMock) -> None:
         """Should return the captured pane content."""
-        def side_effect(*args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]:
-            cmd = args[0]
-            if "has-session" in cmd:
-                return _make_completed(returncode=0)
-            return _make_completed(stdout="line1\nline2\nline3\n")
-        mock_run.side_effect = side_effect
+        mock_run.return_value = _make_completed(stdout="line1\nline2\nline3\n")
         result = bot_mod.tmux_capture("claude")
         assert "line1" in result
+        assert "capture-pane" in mock_run.call_args[0][0]
 
-    @patch("bot.bot.subprocess.run")
     def test_returns_placeholder_when_missing(self, mock_run: MagicMock) -> None:
         """Should return a placeholder when the session doesn't exist."""
         mock_run.return_value = _make_completed(returncode=1)
         result = bot_mod.tmux_capture("nonexistent")
         assert result == "(セッションなし)"
+        assert mock_run.call_count == 1
 
-    @patch("bot.bot.subprocess.run")
     def test_returns_empty_placeholder(self, mock_run: MagicMock) -> None:
         """Should return '(空)' when the pane is empty."""
-        def side_effect(*args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]:
-            cmd = args[0]
-            if "has-session" in cmd:
-                return _make_completed(returncode=0)
-            return _make_completed(stdout="")
-        mock_run.side_effect = side_effect
+        mock_run.return_value = _make_completed(stdout="")
         result = bot_mod.tmux_capture("claude")
         assert result == "(空)"
 
+    def test_truncates_to_max_length(self, mock_run: MagicMock) -> None:
+        """Should keep only the tail of the pane when max_length is given."""
+        mock_run.return_value = _make_completed(stdout="abcdef\n")
+        result = bot_mod._tmux.capture("claude", max_length=3)
+        assert result == "...\ndef"
+
+    def test_replaces_invalid_utf8(self, mock_run: MagicMock) -> None:
+        """Should not fail on pane bytes that are not valid UTF-8."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=b"ok \xff\n", stderr=b"",
+        )
+        assert bot_mod.tmux_capture("claude") == "ok \ufffd"
+
 
 # ===================================================================
 # MessageRouter.parse_mention (via module-level parse_mention)
@@ -315,6 +409,26 @@ class TestLoadEnv:
             result = bot_mod.load_env()
         assert result == {"URL": "https://example.com?a=1&b=2"}
 
+    def test_parses_unchanged_file_once(self, tmp_path: Any) -> None:
+        """Should reuse the parsed file while its mtime is unchanged."""
+        env_file = tmp_path / "test.env"
+        env_file.write_text("FOO=bar\n")
+        with patch.object(bot_mod, "ENV_FILE", env_file), \
+             patch.object(Path, "open", wraps=env_file.open) as mock_open_:
+            assert bot_mod.load_env() == {"FOO": "bar"}
+            assert bot_mod.load_env() == {"FOO": "bar"}
+            assert mock_open_.call_count == 1
+
+    def test_reparses_after_change(self, tmp_path: Any) -> None:
+        """Should pick up edits once the file's mtime changes."""
+        env_file = tmp_path / "test.env"
+        env_file.write_text("FOO=bar\n")
+        with patch.object(bot_mod, "ENV_FILE", env_file):
+            assert bot_mod.load_env() == {"FOO": "bar"}
+            env_file.write_text("FOO=changed\n")
+            os.utime(env_file, ns=(0, env_file.stat().st_mtime_ns + 1))
+            assert bot_mod.load_env() == {"FOO": "changed"}
+
 
 # ===================================================================
 # SlackBot._handle_message (unauthorized user)
@@ -323,17 +437,59 @@ class TestLoadEnv:
 class TestHandleMessageUnauthorized:
     """Tests for handle_message() with unauthorized users."""
 
-    def test_ignores_unauthorized_user(self, mock_say: MagicMock) -> None:
-        """Should silently ignore messages from unauthorized users."""
-        event = {
-            "user": "U_UNAUTHORIZED",
-            "text": "テスト実行して",
-            "channel_type": "im",
+    @staticmethod
+    def _dm_body(**event: Any) -> dict[str, Any]:
+        return {
+            "type": "event_callback",
+            "event": {"type": "message", "channel_type": "im", **event},
         }
-        with patch.object(bot_mod._bot.tmux, "list_sessions") as mock_sessions:
-            bot_mod.handle_message(event, mock_say)
-            mock_say.assert_not_called()
-            mock_sessions.assert_not_called()
+
+    def test_ignores_unauthorized_user(self, mock_ack: MagicMock) -> None:
+        """The auth middleware should ack and drop unauthorized requests."""
+        context = BoltContext({"user_id": "U_UNAUTHORIZED"})
+        mock_next = MagicMock()
+        with patch.object(bot_mod._bot.log, "warning") as mock_warning:
+            result = bot_mod._bot._authorize(
+                context, self._dm_body(user="U_UNAUTHORIZED"), mock_ack, mock_next,
+            )
+        mock_next.assert_not_called()
+        mock_ack.assert_called_once()
+        assert result is mock_ack.return_value
+        mock_warning.assert_called_once()
+
+    def test_warns_on_unauthorized_block_action(self, mock_ack: MagicMock) -> None:
+        """Button presses by other users should be reported."""
+        context = BoltContext({"user_id": "U_UNAUTHORIZED"})
+        with patch.object(bot_mod._bot.log, "warning") as mock_warning:
+            bot_mod._bot._authorize(
+                context, {"type": "block_actions"}, mock_ack, MagicMock(),
+            )
+        mock_warning.assert_called_once()
+
+    @pytest.mark.parametrize("body", [
+        {"type": "event_callback", "event": {"type": "message", "channel_type": "channel"}},
+        {"type": "event_callback", "event": {"channel_type": "im", "bot_id": "B123"}},
+        {"type": "event_callback", "event": {"channel_type": "im", "subtype": "message_changed"}},
+    ])
+    def test_silently_drops_non_dm_traffic(
+        self, mock_ack: MagicMock, body: dict[str, Any],
+    ) -> None:
+        """Channel, bot and subtype events should be acked without a warning."""
+        context = BoltContext({"user_id": "U_OTHER"})
+        mock_next = MagicMock()
+        with patch.object(bot_mod._bot.log, "warning") as mock_warning:
+            bot_mod._bot._authorize(context, body, mock_ack, mock_next)
+        mock_warning.assert_not_called()
+        mock_next.assert_not_called()
+        mock_ack.assert_called_once()
+
+    def test_passes_allowed_user(self, mock_ack: MagicMock) -> None:
+        """The auth middleware should hand allowed requests to the listener."""
+        context = BoltContext({"user_id": "U_ALLOWED"})
+        mock_next = MagicMock()
+        bot_mod._bot._authorize(context, self._dm_body(user="U_ALLOWED"), mock_ack, mock_next)
+        mock_next.assert_called_once()
+        mock_ack.assert_not_called()
 
     def test_ignores_bot_messages(self, mock_say: MagicMock) -> None:
         """Should ignore events with bot_id set."""
@@ -353,7 +509,9 @@ class TestHandleMessageUnauthorized:
             "text": "hello",
             "channel_type": "channel",
         }
-        bot_mod.handle_message(event, mock_say)
+        with patch.object(bot_mod._bot.log, "info") as mock_info:
+            bot_mod.handle_message(event, mock_say)
+            mock_info.assert_not_called()
         mock_say.assert_not_called()
 
     def test_empty_message(self, mock_say: MagicMock) -> None:
@@ -383,13 +541,19 @@ class TestHandleMessageAuthorized:
             "channel_type": "im",
         }
         with patch.object(bot_mod._bot.tmux, "list_sessions", return_value=["claude"]), \
-             patch.object(bot_mod._bot.tmux, "session_exists", return_value=True), \
              patch.object(bot_mod._bot.tmux, "send", return_value=True) as mock_send:
             bot_mod.handle_message(event, mock_say)
             mock_send.assert_called_once_with("claude", "テスト実行して")
             mock_say.assert_called_once()
             assert "送信しました" in mock_say.call_args[0][0]
 
+    def test_reports_missing_session_after_failed_send(self, mock_say: MagicMock) -> None:
+        """Should report a missing session only after the send fails."""
+        with patch.object(bot_mod._bot.tmux, "send", return_value=False), \
+             patch.object(bot_mod._bot.tmux, "session_exists", return_value=False):
+            bot_mod.send_to_session("gone", "hi", mock_say)
+            assert "見つかりません" in mock_say.call_args[0][0]
+
     def test_shows_buttons_for_multiple_sessions(self, mock_say: MagicMock) -> None:
         """Should show session selection buttons when multiple sessions exist."""
         event = {
@@ -422,6 +586,16 @@ class TestHandleMessageAuthorized:
                 assert data["prompt"] == "テスト実行して"
                 assert "session" in data
 
+    def test_button_value_escapes_specials(self, mock_say: MagicMock) -> None:
+        """Quotes, backslashes and newlines should survive the button value."""
+        prompt = 'say "hi"\\n\nnext'
+        bot_mod._bot._show_session_buttons(['a"b', "w"], prompt, mock_say)
+        buttons = mock_say.call_args[1]["blocks"][1]["elements"]
+        assert [json.loads(btn["value"]) for btn in buttons] == [
+            {"session": 'a"b', "prompt": prompt},
+            {"session": "w", "prompt": prompt},
+        ]
+
     def test_sessions_command(self, mock_say: MagicMock) -> None:
         """Should list sessions when 'sessions' command is sent."""
         event = {
@@ -434,6 +608,78 @@ class TestHandleMessageAuthorized:
             mock_say.assert_called_once()
             assert "セッション一覧" in mock_say.call_args[0][0]
 
+    def test_ls_alias_dispatches_to_sessions(self, mock_say: MagicMock) -> None:
+        """Should route the 'ls' alias to the session list handler."""
+        event = {
+            "user": "U_ALLOWED",
+            "text": "LS",
+            "channel_type": "im",
+        }
+        with patch.object(bot_mod._bot.tmux, "list_sessions", return_value=["s1"]):
+            bot_mod.handle_message(event, mock_say)
+            assert "セッション一覧" in mock_say.call_args[0][0]
+
+    def test_status_summary_shows_last_line(self, mock_say: MagicMock) -> None:
+        """The status overview should show each pane's last non-blank line."""
+        panes = {"s1": "build\n  done", "s2": "(空)"}
+        with patch.object(bot_mod._bot.tmux, "list_sessions", return_value=["s1", "s2"]), \
+             patch.object(bot_mod._bot.tmux, "capture_many", return_value=panes):
+            bot_mod.handle_status("status", mock_say)
+            reply = mock_say.call_args[0][0]
+            assert "`s1`:   done" in reply
+            assert "`s2`: (空)" in reply
+
+    def test_sessions_reply_rebuilt_on_change(self, mock_say: MagicMock) -> None:
+        """Should reuse the rendered list until the sessions change."""
+        with patch.object(bot_mod._bot.tmux, "list_sessions", return_value=["s1"]):
+            bot_mod._bot._handle_sessions_list("sessions", mock_say)
+            first = mock_say.call_args[0][0]
+            bot_mod._bot._handle_sessions_list("sessions", mock_say)
+            assert mock_say.call_args[0][0] is first
+        with patch.object(bot_mod._bot.tmux, "list_sessions", return_value=["s1", "s2"]):
+            bot_mod._bot._handle_sessions_list("sessions", mock_say)
+            assert "`s2`" in mock_say.call_args[0][0]
+            assert "(2個)" in mock_say.call_args[0][0]
+
+
+# ===================================================================
+# SlackBot._handle_action (button routing)
+# ===================================================================
+
+class TestHandleAction:
+    """Tests for routing button actions by action_id prefix."""
+
+    def test_routes_session_select(
+        self, mock_ack: MagicMock, mock_respond: MagicMock, mock_say: MagicMock,
+    ) -> None:
+        """send_to_* buttons should send the embedded prompt."""
+        action = {
+            "action_id": "send_to_worker1",
+            "value": json.dumps({"session": "worker1", "prompt": "hi"}),
+        }
+        with patch.object(bot_mod._bot.tmux, "send", return_value=True) as mock_send:
+            bot_mod._bot._handle_action(mock_ack, action, mock_respond, mock_say)
+            mock_ack.assert_called_once()
+            mock_send.assert_called_once_with("worker1", "hi")
+
+    def test_routes_hook_deny(
+        self, mock_ack: MagicMock, mock_respond: MagicMock, mock_say: MagicMock,
+    ) -> None:
+        """hook_deny should send 'n' to the session in the button value."""
+        action = {"action_id": "hook_deny", "value": "claude"}
+        with patch.object(bot_mod._bot.tmux, "send", return_value=True) as mock_send, \
+             patch.object(bot_mod._bot, "clear_pending_approvals"):
+            bot_mod._bot._handle_action(mock_ack, action, mock_respond, mock_say)
+            mock_send.assert_called_once_with("claude", "n")
+
+    def test_pattern_leaves_foreign_actions(self) -> None:
+        """Only this bot's action_ids should match the listener pattern."""
+        pattern = bot_mod.SlackBot.ACTION_ID_PATTERN
+        assert pattern.search("send_to_claude")
+        assert pattern.search("hook_approve")
+        assert pattern.search("proposal_approve") is None
+        assert pattern.search("hook_approve_all") is None
+
 
 # ===================================================================
 # MessageRouter class direct tests
@@ -452,6 +698,15 @@ class TestMessageRouter:
         assert self.router.strip_cc_prefix("CC: hello") == "hello"
         assert self.router.strip_cc_prefix("hello") == "hello"
 
+    def test_parse_command(self) -> None:
+        """Should classify special commands regardless of case."""
+        assert self.router.parse_command("Status claude") == "status"
+        assert self.router.parse_command("LS") == "sessions"
+        assert self.router.parse_command("run the tests") is None
+        assert self.router.parse_command("  status\n") == "status"
+        assert self.router.parse_command("statuses of the build") is None
+        assert self.router.parse_command("ls " + "x" * 1000) is None
+
     def test_is_status_command(self) -> None:
         """Should identify status commands."""
         assert self.router.is_status_command("status") is True
@@ -485,39 +740,276 @@ class TestTmuxManagerClass:
         """Create a fresh TmuxManager instance for each test."""
         self.tmux: bot_mod.TmuxManager = bot_mod.TmuxManager(capture_lines=30)
 
-    @patch("bot.bot.subprocess.run")
     def test_list_sessions(self, mock_run: MagicMock) -> None:
         """Should delegate to tmux list-sessions command."""
         mock_run.return_value = _make_completed(stdout="s1\ns2\n")
         result = self.tmux.list_sessions()
         assert result == ["s1", "s2"]
 
-    @patch("bot.bot.subprocess.run")
     def test_session_exists(self, mock_run: MagicMock) -> None:
         """Should delegate to tmux has-session command."""
         mock_run.return_value = _make_completed(returncode=0)
         assert self.tmux.session_exists("s1") is True
 
-    @patch("bot.bot.subprocess.run")
     def test_send(self, mock_run: MagicMock) -> None:
         """Should send text and Enter key to the session."""
         mock_run.return_value = _make_completed(returncode=0)
         assert self.tmux.send("s1", "hello") is True
-        assert mock_run.call_count == 3
+        assert mock_run.call_count == 1
 
-    @patch("bot.bot.subprocess.run")
     def test_capture_with_custom_lines(self, mock_run: MagicMock) -> None:
         """Should capture with the configured number of lines."""
-        def side_effect(*args: Any, **kwargs: Any) -> subprocess.CompletedProcess[str]:
-            cmd = args[0]
-            if "has-session" in cmd:
-                return _make_completed(returncode=0)
-            # Verify custom lines parameter is passed
-            assert "30" in cmd
-            return _make_completed(stdout="content\n")
-        mock_run.side_effect = side_effect
+        mock_run.return_value = _make_completed(stdout="content\n")
         result = self.tmux.capture("s1")
         assert result == "content"
+        assert "-30" in mock_run.call_args[0][0]
+
+    def test_capture_many_single_invocation(self, mock_run: MagicMock) -> None:
+        """Should capture all sessions with one chained tmux command."""
+        sep = bot_mod.TmuxManager.CAPTURE_SEPARATOR
+        mock_run.return_value = _make_completed(
+            stdout=f"a1\na2\n{sep}\n\n{sep}\n",
+        )
+        result = self.tmux.capture_many(["s1", "s2"])
+        assert result == {"s1": "a1\na2", "s2": "(空)"}
+        assert mock_run.call_count == 1
+        cmd = mock_run.call_args[0][0]
+        assert cmd.count("capture-pane") == 2
+        assert cmd[-1] == sep
+
+    def test_capture_many_falls_back_after_failure(self, mock_run: MagicMock) -> None:
+        """Should capture sessions individually once the chain aborts."""
+        sep = bot_mod.TmuxManager.CAPTURE_SEPARATOR
+
+        def fake_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+            if ";" in cmd:
+                return _make_completed(returncode=1, stdout=f"a1\n{sep}\n")
+            if "gone" in cmd:
+                return _make_completed(returncode=1)
+            return _make_completed(stdout="c1\n")
+
+        mock_run.side_effect = fake_run
+        result = self.tmux.capture_many(["s1", "gone", "s3"])
+        assert result == {"s1": "a1", "gone": "(セッションなし)", "s3": "c1"}
+
+
+# ===================================================================
+# TmuxControl class tests
+# ===================================================================
+
+class TestTmuxControl:
+    """Tests for the TmuxControl control-mode connection."""
+
+    def _connect(self, stdout: str | io.TextIOBase) -> bot_mod.TmuxControl:
+        """Build a TmuxControl wired to a fake control client process."""
+        control = bot_mod.TmuxControl()
+        proc = MagicMock()
+        proc.poll.return_value = None
+        proc.stdout = io.StringIO(stdout) if isinstance(stdout, str) else stdout
+        control._attach(proc)
+        return control
+
+    def test_quote_escapes_specials(self) -> None:
+        """Should keep multi-line text on one command line."""
+        quoted = bot_mod.TmuxControl.quote('a\nb "c" $d \\e')
+        assert quoted == '"a\\012b \\"c\\" \\$d \\\\e"'
+        assert "\n" not in quoted
+
+    def test_quote_escapes_tilde(self) -> None:
+        """Should keep tmux from expanding a leading ~ to the home directory."""
+        assert bot_mod.TmuxControl.quote("~/.zshrc ~x") == '"\\~/.zshrc \\~x"'
+
+    def test_run_reads_reply_block(self) -> None:
+        """Should skip notifications and return the command output."""
+        control = self._connect(
+            "%output %1 x\n"
+            "%begin 1 10 1\nclaude\nworker1\n%end 1 10 1\n"
+        )
+        assert control.run(["list-sessions"]) == (0, "claude\nworker1\n")
+        control._proc.stdin.write.assert_called_once_with('"list-sessions"\n')
+
+    def test_run_stops_chain_on_error(self) -> None:
+        """Should report failure and drop the error text from the output."""
+        control = self._connect(
+            "%begin 1 11 1\nline\n%end 1 11 1\n"
+            "%begin 1 12 1\ncan't find pane: zz\n%error 1 12 1\n"
+        )
+        assert control.run(["capture-pane"], ["capture-pane"]) == (1, "line\n")
+
+    def test_run_quotes_literal_separator(self) -> None:
+        """A ";" argument must stay an argument, not split the chain."""
+        control = self._connect(
+            "%begin 1 13 1\n%end 1 13 1\n%begin 1 14 1\n%end 1 14 1\n"
+        )
+        assert control.run(
+            ["send-keys", "-t", "w", "-l", "--", ";"], ["send-keys", "-t", "w", "Enter"],
+        ) == (0, "")
+        control._proc.stdin.write.assert_called_once_with(
+            '"send-keys" "-t" "w" "-l" "--" ";" ; "send-keys" "-t" "w" "Enter"\n'
+        )
+
+    def test_run_drops_connection_on_reply_timeout(self) -> None:
+        """A missing reply should fail the command instead of blocking forever."""
+        read_fd, write_fd = os.pipe()
+        stdout = open(read_fd, encoding="utf-8")
+        try:
+            with patch.object(bot_mod.TmuxControl, "REPLY_TIMEOUT", 0.05):
+                control = self._connect(stdout)
+                assert control.run(["list-sessions"]) == (1, "")
+                assert control._proc is None
+        finally:
+            # EOF first, so the reader thread lets go of the file.
+            os.close(write_fd)
+            time.sleep(0.05)
+            stdout.close()
+
+    def test_run_returns_none_when_disconnected(self) -> None:
+        """Should signal the caller to fall back when the client is gone."""
+        control = self._connect("%exit\n")
+        assert control.run(["list-sessions"]) == (1, "")
+        assert control.connected is False
+        assert control.run(["list-sessions"]) is None
+
+    def test_manager_falls_back_to_subprocess(self, mock_run: MagicMock) -> None:
+        """TmuxManager should spawn tmux when the control client is down."""
+        mock_run.return_value = _make_completed(stdout="s1\n")
+        tmux = bot_mod.TmuxManager()
+        tmux.control = bot_mod.TmuxControl()
+        with patch.object(tmux.control, "start", return_value=False):
+            assert tmux.list_sessions() == ["s1"]
+        assert mock_run.call_count == 1
+
+    def test_send_not_retried_after_lost_reply(self, mock_run: MagicMock) -> None:
+        """A send whose reply is lost must fail rather than type the text twice."""
+        tmux = bot_mod.TmuxManager()
+        read_fd, write_fd = os.pipe()
+        stdout = open(read_fd, encoding="utf-8")
+        try:
+            with patch.object(bot_mod.TmuxControl, "REPLY_TIMEOUT", 0.05):
+                tmux.control = self._connect(stdout)
+                assert tmux.send("claude", "hello") is False
+        finally:
+            os.close(write_fd)
+            time.sleep(0.05)
+            stdout.close()
+        mock_run.assert_not_called()
+
+    def test_manager_reconnects_once_per_interval(self, mock_run: MagicMock) -> None:
+        """A dropped connection should be restarted, but not on every call."""
+        mock_run.return_value = _make_completed()
+        tmux = bot_mod.TmuxManager()
+        tmux.control = self._connect("%exit\n")
+        tmux.control.run(["list-sessions"])
+        with patch.object(tmux.control, "start", return_value=False) as mock_start:
+            tmux.session_exists("s1")
+            tmux.session_exists("s1")
+            mock_start.assert_called_once()
+
+    def test_read_pane(self, mock_run: MagicMock) -> None:
+        """read_pane should strip output and report failures as None."""
+        tmux = bot_mod.TmuxManager()
+        mock_run.return_value = _make_completed(stdout="prompt> \n\n")
+        assert tmux.read_pane("s1", 5) == "prompt>"
+        assert "-5" in mock_run.call_args[0][0]
+        mock_run.return_value = _make_completed(returncode=1)
+        assert tmux.read_pane("gone", 5) is None
+
+    def test_cli_argv_escapes_trailing_semicolons(self) -> None:
+        """Subprocess argv must not let argument values split the chain."""
+        argv = bot_mod.TmuxManager._cli_argv([
+            ["send-keys", "-l", "--", ";"], ["send-keys", "-l", "--", "a\\;"],
+        ])
+        assert argv == [
+            bot_mod._TMUX, "send-keys", "-l", "--", "\\;", ";",
+            "send-keys", "-l", "--", "a\\\\;",
+        ]
+
+
+# ===================================================================
+# SlackBot.prune_pending_approvals
+# ===================================================================
+
+class TestPrunePendingApprovals:
+    """Tests for bounding the pending approvals list."""
+
+    def test_drops_expired_entries(self) -> None:
+        """Should discard entries older than the TTL and malformed ones."""
+        now = time.time()
+        pending = [
+            {"ts": f"{now - bot_mod.SlackBot.PENDING_APPROVAL_TTL - 1:.6f}"},
+            {"ts": "not-a-timestamp"},
+            {"ts": f"{now:.6f}", "session": "claude"},
+        ]
+        assert bot_mod._bot.prune_pending_approvals(pending) == [pending[2]]
+
+    def test_caps_entry_count(self) -> None:
+        """Should keep only the newest PENDING_APPROVALS_MAX entries."""
+        now = time.time()
+        limit = bot_mod.SlackBot.PENDING_APPROVALS_MAX
+        pending = [{"ts": f"{now + i:.6f}"} for i in range(limit + 5)]
+        kept = bot_mod._bot.prune_pending_approvals(pending)
+        assert len(kept) == limit
+        assert kept[-1] == pending[-1]
+
+
+class TestPollPendingApprovals:
+    """Tests for the pending approval poller's polling tiers."""
+
+    def test_cold_entries_polled_less_often(self, tmp_path: Any) -> None:
+        """Old unresolved prompts should only be captured every few ticks."""
+        now = time.time()
+        pending = [
+            {"session": "cold", "ts": str(now - 1000), "pane_snapshot": "x"},
+            {"session": "hot", "ts": str(now), "pane_snapshot": "x"},
+        ]
+        path = tmp_path / "pending.json"
+        path.write_text(json.dumps(pending))
+        ticks = bot_mod.SlackBot.PENDING_COLD_POLL_EVERY
+        sleeps = [None] * ticks + [KeyboardInterrupt()]
+        with patch.object(bot_mod.SlackBot, "PENDING_APPROVALS_FILE", path), \
+             patch("bot.bot.time.sleep", side_effect=sleeps), \
+             patch.object(bot_mod._bot.tmux, "read_pane", return_value="x") as mock_read:
+            with pytest.raises(KeyboardInterrupt):
+                bot_mod._bot._poll_pending_approvals()
+        polled = [c.args[0] for c in mock_read.call_args_list]
+        assert polled.count("hot") == ticks
+        assert polled.count("cold") == 1
+
+    def test_pruned_entries_are_expired_on_slack(self, tmp_path: Any) -> None:
+        """Entries dropped by pruning should have their buttons replaced."""
+        now = time.time()
+        stale = {
+            "session": "old", "channel": "D1",
+            "ts": f"{now - bot_mod.SlackBot.PENDING_APPROVAL_TTL - 1:.6f}",
+        }
+        fresh = {"session": "new", "channel": "D1", "ts": f"{now:.6f}", "pane_snapshot": "x"}
+        path = tmp_path / "pending.json"
+        path.write_text(json.dumps([stale, fresh]))
+        with patch.object(bot_mod.SlackBot, "PENDING_APPROVALS_FILE", path), \
+             patch("bot.bot.time.sleep", side_effect=[None, KeyboardInterrupt()]), \
+             patch.object(bot_mod._bot.tmux, "read_pane", return_value="x"), \
+             patch("urllib.request.urlopen") as mock_urlopen:
+            with pytest.raises(KeyboardInterrupt):
+                bot_mod._bot._poll_pending_approvals()
+        mock_urlopen.assert_called_once()
+        payload = json.loads(mock_urlopen.call_args[0][0].data)
+        assert payload["ts"] == stale["ts"]
+        assert payload["blocks"] == bot_mod.SlackBot._EXPIRED_PAYLOAD["blocks"]
+        assert json.loads(path.read_text()) == [fresh]
+
+
+class TestResolveSlackMessages:
+    """Tests for SlackBot._resolve_slack_messages()."""
+
+    @patch("urllib.request.urlopen")
+    def test_updates_each_entry(self, mock_urlopen: MagicMock) -> None:
+        """Should send one chat.update per entry with the resolved blocks."""
+        entries = [{"channel": "D1", "ts": "1.0"}, {"channel": "D1", "ts": "2.0"}]
+        bot_mod._bot._resolve_slack_messages(entries)
+        assert mock_urlopen.call_count == 2
+        payload = json.loads(mock_urlopen.call_args[0][0].data)
+        assert payload["ts"] == "2.0"
+        assert payload["blocks"] == bot_mod.SlackBot._RESOLVED_PAYLOAD["blocks"]
 
 
 # ===================================================================
@@ -543,3 +1035,29 @@ class TestConfigClass:
         assert bot_mod.Config.BUTTON_VALUE_MAX_LENGTH == 1900
         assert bot_mod.Config.STATUS_PANE_MAX_LENGTH == 2500
         assert bot_mod.Config.STATUS_LINE_MAX_LENGTH == 80
+        assert bot_mod.Config.WORKER_POOL_SIZE == 16
+
+
+# ===================================================================
+# skill/bot.py deployment copy
+# ===================================================================
+
+class TestSkillCopy:
+    """Tests for the standalone bot copy shipped with the skill."""
+
+    @staticmethod
+    def _shared_source(path: Path) -> str:
+        """Return a bot source with the local Content Scout registration removed."""
+        return re.sub(
+            r"# --- Content Scout .*?(?=# --- )",
+            "",
+            path.read_text(encoding="utf-8"),
+            flags=re.DOTALL,
+        )
+
+    def test_skill_copy_matches_bot(self) -> None:
+        """skill/bot.py must not drift from bot/bot.py beyond the Content Scout hook."""
+        root = Path(__file__).resolve().parent.parent
+        assert self._shared_source(root / "skill" / "bot.py") == self._shared_source(
+            root / "bot" / "bot.py"
+        )